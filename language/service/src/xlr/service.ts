@@ -16,19 +16,20 @@ export interface XLRContext {
   nearestObjects: Array<ObjectType>;
 }
 
+/** AST node types that map directly to a registered XLR */
+const BaseTypes: ReadonlySet<string> = new Set([
+  'asset',
+  'view',
+  'flow',
+  'content',
+  'navigation',
+  'state',
+]);
+
 /**
  * XLRs Manager for
  */
 export class XLRService {
-  private baseTypes = [
-    'asset',
-    'view',
-    'flow',
-    'content',
-    'navigation',
-    'state',
-  ];
-
   public XLRSDK: XLRSDK;
 
   constructor() {
@@ -47,7 +48,7 @@ export class XLRService {
         path: ASTNode[];
       }
     | undefined {
-    if (this.baseTypes.indexOf(n.type) > -1) {
+    if (BaseTypes.has(n.type)) {
       if (n.type === 'asset') {
         const name = this.XLRSDK.hasType(n.assetType?.valueNode?.value ?? '')
           ? (n.assetType?.valueNode?.value as string)
@@ -148,7 +149,7 @@ export class XLRService {
           }
         } else if (
           pathSegment.type === 'object' ||
-          this.baseTypes.indexOf(pathSegment.type) !== -1
+          BaseTypes.has(pathSegment.type)
         ) {
           newNode = nodePointer;
         } else if (pathSegment.type === 'array') {
@@ -349,3 +349,128 @@ describe('Type Exports', () => {
     `);
   });
 });
+
+describe('Single Member Type Exports', () => {
+  /** Converts a named XLR and prints the resulting declaration */
+  const convertAndPrint = (xlr: NamedType) => {
+    const converter = new TSWriter(ts.factory);
+    const { type: tsNode } = converter.convertNamedType(xlr);
+
+    const printer = ts.createPrinter({ newLine: ts.NewLineKind.LineFeed });
+    const resultFile = ts.createSourceFile(
+      'output.d.ts',
+      '',
+      ts.ScriptTarget.ES2017,
+      false, // setParentNodes
+      ts.ScriptKind.TS
+    );
+
+    return printer.printNode(ts.EmitHint.Unspecified, tsNode, resultFile);
+  };
+
+  it('Named single member union of an object stays a type alias', () => {
+    const xlr = {
+      name: 'test',
+      source: 'test.ts',
+      type: 'or',
+      or: [
+        {
+          type: 'object',
+          properties: {
+            foo: {
+              required: true,
+              node: {
+                type: 'string',
+              },
+            },
+          },
+          additionalProperties: false,
+        },
+      ],
+    } as NamedType;
+
+    expect(convertAndPrint(xlr)).toBe(
+      'export type test = {\n    foo: string;\n};'
+    );
+  });
+
+  it('Nested single member union converts to its member', () => {
+    const xlr = {
+      name: 'test',
+      source: 'test.ts',
+      type: 'object',
+      properties: {
+        foo: {
+          required: true,
+          node: {
+            type: 'or',
+            or: [
+              {
+                type: 'ref',
+                ref: 'Foo',
+              },
+            ],
+          },
+        },
+      },
+      additionalProperties: false,
+    } as NamedType;
+
+    expect(convertAndPrint(xlr)).toBe(
+      'export interface test {\n    foo: Foo;\n}'
+    );
+  });
+
+  it('Named single member intersection of an object stays a type alias', () => {
+    const xlr = {
+      name: 'test',
+      source: 'test.ts',
+      type: 'and',
+      and: [
+        {
+          type: 'object',
+          properties: {
+            foo: {
+              required: true,
+              node: {
+                type: 'string',
+              },
+            },
+          },
+          additionalProperties: false,
+        },
+      ],
+    } as NamedType;
+
+    expect(convertAndPrint(xlr)).toBe(
+      'export type test = {\n    foo: string;\n};'
+    );
+  });
+
+  it('Nested single member intersection converts to its member', () => {
+    const xlr = {
+      name: 'test',
+      source: 'test.ts',
+      type: 'object',
+      properties: {
+        foo: {
+          required: true,
+          node: {
+            type: 'and',
+            and: [
+              {
+                type: 'ref',
+                ref: 'Foo',
+              },
+            ],
+          },
+        },
+      },
+      additionalProperties: false,
+    } as NamedType;
+
+    expect(convertAndPrint(xlr)).toBe(
+      'export interface test {\n    foo: Foo;\n}'
+    );
+  });
+});
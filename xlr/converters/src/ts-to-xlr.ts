@@ -40,13 +40,21 @@ import {
 } from '@player-tools/xlr-utils';
 import { ConversionError } from './types';
 
+/** Names of TypeScript's MappedTypes */
+const MappedTypes: ReadonlySet<string> = new Set([
+  'Pick',
+  'Omit',
+  'Required',
+  'Partial',
+]);
+
 /**
  * Returns if the string is one of TypeScript's MappedTypes
  */
 export function isMappedTypeNode(
   x: string
 ): x is 'Pick' | 'Omit' | 'Required' | 'Partial' {
-  return ['Pick', 'Omit', 'Required', 'Partial'].includes(x);
+  return MappedTypes.has(x);
 }
 
 export interface TSConverterContext {
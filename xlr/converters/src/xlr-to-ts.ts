@@ -113,7 +113,8 @@ export class TSWriter {
     }
 
     let finalNode;
-    if (ts.isTypeLiteralNode(tsNode)) {
+    // Single member unions/intersections of objects stay type aliases
+    if (type.type === 'object' && ts.isTypeLiteralNode(tsNode)) {
       finalNode = this.makeInterfaceDeclaration(
         typeName,
         tsNode.members,
@@ -133,6 +134,10 @@ export class TSWriter {
     }
 
     if (type.type === 'and') {
+      if (type.and.length === 1) {
+        return this.convertTypeNode(type.and[0]);
+      }
+
       return this.context.factory.createIntersectionTypeNode(
         type.and.map((element) => {
           return this.convertTypeNode(element);
@@ -141,6 +146,10 @@ export class TSWriter {
     }
 
     if (type.type === 'or') {
+      if (type.or.length === 1) {
+        return this.convertTypeNode(type.or[0]);
+      }
+
       return this.context.factory.createUnionTypeNode(
         type.or.map((element) => {
           return this.convertTypeNode(element);
@@ -383,23 +392,20 @@ export class TSWriter {
   private createObjectNode(xlrNode: ObjectType): ts.TypeLiteralNode {
     const { properties, additionalProperties = false } = xlrNode;
 
-    const propertyNodes: Array<ts.TypeElement> = [
-      ...Object.keys(properties)
-        .map((name) => ({ name, ...properties[name] }))
-        .map(({ name, node, required }) =>
-          this.makeAnnotations(
-            this.context.factory.createPropertySignature(
-              undefined, // modifiers
-              name,
-              required
-                ? undefined
-                : this.context.factory.createToken(ts.SyntaxKind.QuestionToken),
-              this.convertTypeNode(node)
-            ),
-            node
-          )
-        ),
-    ];
+    const propertyNodes: Array<ts.TypeElement> = Object.entries(properties).map(
+      ([name, { node, required }]) =>
+        this.makeAnnotations(
+          this.context.factory.createPropertySignature(
+            undefined, // modifiers
+            name,
+            required
+              ? undefined
+              : this.context.factory.createToken(ts.SyntaxKind.QuestionToken),
+            this.convertTypeNode(node)
+          ),
+          node
+        )
+    );
 
     if (additionalProperties) {
       propertyNodes.push(
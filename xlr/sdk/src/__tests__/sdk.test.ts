@@ -140,6 +140,30 @@ describe('Export Test', () => {
     expect(results[0][1]).toMatchSnapshot();
   });
 
+  it('Exports Typescript Types With Multiple Import Packages', () => {
+    const importMap = new Map([
+      ['@player-ui/types', ['Asset', 'AssetWrapper']],
+      ['@player-ui/expressions', ['Expression', 'Binding']],
+    ]);
+
+    const sdk = new XLRSDK();
+    sdk.loadDefinitionsFromDisk('./common/static_xlrs/plugin');
+    sdk.loadDefinitionsFromDisk('./common/static_xlrs/core', EXCLUDE);
+    const results = sdk.exportRegistry('TypeScript', importMap, {
+      typeFilter: 'Transformed',
+      pluginFilter: 'Types',
+    });
+    const importLines = results[0][1]
+      .split('\n')
+      .filter((line) => line.startsWith('import '));
+
+    // Later packages in the import map are emitted first
+    expect(importLines).toStrictEqual([
+      'import { Expression, Binding } from "@player-ui/expressions";',
+      'import { Asset, AssetWrapper } from "@player-ui/types";',
+    ]);
+  });
+
   it('Exports Typescript Types With Transforms', () => {
     const importMap = new Map([
       [
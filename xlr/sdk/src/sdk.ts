@@ -55,19 +55,17 @@ export class XLRSDK {
     filters?: Omit<Filters, 'pluginFilter'>,
     transforms?: Array<TransformFunction>
   ) {
-    const manifest = JSON.parse(
-      fs.readFileSync(path.join(inputPath, 'xlr', 'manifest.json')).toString(),
-      (key: unknown, value: unknown) => {
-        // Custom parser because JSON objects -> JS Objects, not maps
-        if (typeof value === 'object' && value !== null) {
-          if (key === 'capabilities') {
-            return new Map(Object.entries(value));
-          }
-        }
+    const rawManifest = JSON.parse(
+      fs.readFileSync(path.join(inputPath, 'xlr', 'manifest.json')).toString()
+    );
 
-        return value;
-      }
-    ) as Manifest;
+    // Convert after parsing because JSON objects -> JS Objects, not maps
+    const manifest: Manifest = {
+      ...rawManifest,
+      capabilities: rawManifest.capabilities
+        ? new Map(Object.entries(rawManifest.capabilities))
+        : undefined,
+    };
 
     manifest.capabilities?.forEach((capabilityList, capabilityName) => {
       if (
@@ -84,15 +82,11 @@ export class XLRSDK {
               )
               .toString()
           );
-          const effectiveType =
-            transforms?.reduce(
-              (typeAccumulator: NamedType<NodeType>, transformFn) =>
-                transformFn(
-                  typeAccumulator,
-                  capabilityName
-                ) as NamedType<NodeType>,
-              cType
-            ) ?? cType;
+          const effectiveType = this.applyTransforms(
+            cType,
+            capabilityName,
+            transforms
+          );
 
           this.registry.add(effectiveType, manifest.pluginName, capabilityName);
         }
@@ -124,15 +118,11 @@ export class XLRSDK {
           !filters?.typeFilter ||
           !extension.name.match(filters?.typeFilter)
         ) {
-          const effectiveType =
-            transforms?.reduce(
-              (typeAccumulator: NamedType<NodeType>, transformFn) =>
-                transformFn(
-                  typeAccumulator,
-                  capabilityName
-                ) as NamedType<NodeType>,
-              extension
-            ) ?? extension;
+          const effectiveType = this.applyTransforms(
+            extension,
+            capabilityName,
+            transforms
+          );
 
           this.registry.add(effectiveType, manifest.pluginName, capabilityName);
         }
@@ -237,17 +227,11 @@ export class XLRSDK {
   ): [string, string][] {
     const typesToExport = this.registry.list(filters).map((type) => {
       const resolvedType = this.resolveType(type);
-      const effectiveType =
-        transforms?.reduce(
-          (typeAccumulator: NamedType<NodeType>, transformFn) =>
-            transformFn(
-              typeAccumulator,
-              this.registry.info(type.name)?.capability as string
-            ) as NamedType<NodeType>,
-          resolvedType
-        ) ?? resolvedType;
-
-      return effectiveType;
+      return this.applyTransforms(
+        resolvedType,
+        this.registry.info(type.name)?.capability as string,
+        transforms
+      );
     });
 
     if (exportType === 'TypeScript') {
@@ -258,6 +242,20 @@ export class XLRSDK {
     throw new Error(`Unknown export format ${exportType}`);
   }
 
+  private applyTransforms(
+    type: NamedType<NodeType>,
+    capability: string,
+    transforms?: Array<TransformFunction>
+  ): NamedType<NodeType> {
+    return (
+      transforms?.reduce(
+        (typeAccumulator: NamedType<NodeType>, transformFn) =>
+          transformFn(typeAccumulator, capability) as NamedType<NodeType>,
+        type
+      ) ?? type
+    );
+  }
+
   private resolveType(type: NodeType) {
     return simpleTransformGenerator('object', 'any', (objectNode) => {
       if (objectNode.extends) {
@@ -324,9 +322,11 @@ export class XLRSDK {
       )
     );
 
+    const importDeclarations: Array<ts.ImportDeclaration> = [];
+
     importMap.forEach((imports, packageName) => {
       const applicableImports = imports.filter((i) => referencedImports.has(i));
-      resultFile = ts.factory.updateSourceFile(resultFile, [
+      importDeclarations.push(
         ts.factory.createImportDeclaration(
           /* modifiers */ undefined,
           ts.factory.createImportClause(
@@ -343,11 +343,16 @@ export class XLRSDK {
             )
           ),
           ts.factory.createStringLiteral(packageName)
-        ),
-        ...resultFile.statements,
-      ]);
+        )
+      );
     });
 
+    // Later packages are emitted above earlier ones
+    resultFile = ts.factory.updateSourceFile(resultFile, [
+      ...importDeclarations.reverse(),
+      ...resultFile.statements,
+    ]);
+
     const headerText = printer.printFile(resultFile);
     const nodeText = typesToPrint.join('\n');
     return `${headerText}\n${nodeText}`;
@@ -0,0 +1,66 @@
+import type { NodeType } from '@player-tools/xlr';
+import {
+  isGenericNamedType,
+  isGenericNodeType,
+  isPrimitiveTypeNode,
+} from '../type-checks';
+
+const primitiveNodes: Array<NodeType> = [
+  { type: 'string' },
+  { type: 'number' },
+  { type: 'boolean' },
+  { type: 'null' },
+  { type: 'any' },
+  { type: 'never' },
+  { type: 'undefined' },
+  { type: 'unknown' },
+  { type: 'void' },
+];
+
+const nonPrimitiveNodes: Array<NodeType> = [
+  { type: 'ref', ref: 'Asset' },
+  { type: 'object', properties: {}, additionalProperties: false },
+  { type: 'array', elementType: { type: 'string' } },
+  { type: 'tuple', elementTypes: [], minItems: 0, additionalItems: false },
+  { type: 'record', keyType: { type: 'string' }, valueType: { type: 'any' } },
+  { type: 'and', and: [] },
+  { type: 'or', or: [] },
+  { type: 'template', format: '.*' },
+  { type: 'function', parameters: [] },
+  {
+    type: 'conditional',
+    check: { left: { type: 'string' }, right: { type: 'string' } },
+    value: { true: { type: 'any' }, false: { type: 'never' } },
+  },
+];
+
+describe('isPrimitiveTypeNode', () => {
+  it.each(primitiveNodes)('is true for $type', (node) => {
+    expect(isPrimitiveTypeNode(node)).toBe(true);
+  });
+
+  it.each(nonPrimitiveNodes)('is false for $type', (node) => {
+    expect(isPrimitiveTypeNode(node)).toBe(false);
+  });
+});
+
+describe('isGenericNodeType', () => {
+  it('is true when generic tokens are present', () => {
+    const node = {
+      type: 'ref',
+      ref: 'Asset',
+      genericTokens: [{ symbol: 'T' }],
+    } as NodeType;
+
+    expect(isGenericNodeType(node)).toBe(true);
+    expect(isGenericNamedType(node)).toBe(true);
+  });
+
+  it.each([...primitiveNodes, ...nonPrimitiveNodes])(
+    'is false for $type without generic tokens',
+    (node) => {
+      expect(isGenericNodeType(node)).toBe(false);
+      expect(isGenericNamedType(node)).toBe(false);
+    }
+  );
+});
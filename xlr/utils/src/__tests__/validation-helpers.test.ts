@@ -34,6 +34,37 @@ describe('computeEffectiveObject tests', () => {
     expect(computeEffectiveObject(type1, type2)).toMatchSnapshot();
   });
 
+  it('does not modify the base object', () => {
+    const type1: ObjectType = {
+      type: 'object',
+      properties: {
+        foo: {
+          required: true,
+          node: {
+            type: 'string',
+          },
+        },
+      },
+      additionalProperties: false,
+    };
+
+    const type2: ObjectType = {
+      type: 'object',
+      properties: {
+        bar: {
+          required: false,
+          node: {
+            type: 'number',
+          },
+        },
+      },
+      additionalProperties: false,
+    };
+
+    computeEffectiveObject(type1, type2);
+    expect(Object.keys(type1.properties)).toStrictEqual(['foo']);
+  });
+
   it('Error on property overlap', () => {
     const type1: ObjectType = {
       type: 'object',
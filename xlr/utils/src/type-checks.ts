@@ -96,21 +96,24 @@ export function isGenericNamedType<T extends NamedType = NamedType>(
   return (nt as NamedTypeWithGenerics).genericTokens?.length > 0;
 }
 
+/** `type` values of the `PrimitiveTypes` nodes */
+const PrimitiveTypeNames: ReadonlySet<string> = new Set([
+  'string',
+  'number',
+  'boolean',
+  'null',
+  'any',
+  'never',
+  'undefined',
+  'unknown',
+  'void',
+]);
+
 /**
  * Returns if the node is a `PrimitiveTypes`
  */
 export function isPrimitiveTypeNode(node: NodeType): node is PrimitiveTypes {
-  return (
-    node.type === 'string' ||
-    node.type === 'number' ||
-    node.type === 'boolean' ||
-    node.type === 'null' ||
-    node.type === 'any' ||
-    node.type === 'never' ||
-    node.type === 'undefined' ||
-    node.type === 'unknown' ||
-    node.type === 'void'
-  );
+  return PrimitiveTypeNames.has(node.type);
 }
 
 /**
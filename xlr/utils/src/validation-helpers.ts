@@ -163,32 +163,36 @@ export function computeEffectiveObject(
 ): ObjectType {
   const baseObjectName = base.name ?? 'object literal';
   const operandObjectName = operand.name ?? 'object literal';
-  const newObject = {
-    ...base,
-    name: `${baseObjectName} & ${operandObjectName}`,
-    description: `Effective type combining ${baseObjectName} and ${operandObjectName}`,
-    genericTokens: [
-      ...(isGenericNodeType(base) ? base.genericTokens : []),
-      ...(isGenericNodeType(operand) ? operand.genericTokens : []),
-    ],
-  };
+  const properties = { ...base.properties };
 
   // eslint-disable-next-line no-restricted-syntax, guard-for-in
   for (const property in operand.properties) {
+    const baseProperty = properties[property];
+    const operandProperty = operand.properties[property];
     if (
-      newObject.properties[property] !== undefined &&
-      newObject.properties[property].node.type !==
-        operand.properties[property].node.type &&
-      errorOnOverlap
+      errorOnOverlap &&
+      baseProperty !== undefined &&
+      baseProperty.node.type !== operandProperty.node.type
     ) {
       throw new Error(
         `Can't compute effective type for ${baseObjectName} and ${operandObjectName} because of conflicting properties ${property}`
       );
     }
 
-    newObject.properties[property] = operand.properties[property];
+    properties[property] = operandProperty;
   }
 
+  const newObject = {
+    ...base,
+    name: `${baseObjectName} & ${operandObjectName}`,
+    description: `Effective type combining ${baseObjectName} and ${operandObjectName}`,
+    genericTokens: [
+      ...(isGenericNodeType(base) ? base.genericTokens : []),
+      ...(isGenericNodeType(operand) ? operand.genericTokens : []),
+    ],
+    properties,
+  };
+
   if (newObject.additionalProperties && operand.additionalProperties) {
     newObject.additionalProperties = {
       type: 'and',